@@ -1 +0,0 @@
-./solve.sh 00
@@ -120,26 +120,14 @@ void add_givens(const int grid[9][9]) {
     }
 }
 
-bool read_grid(istream &in, int grid[9][9]) {
-    string all;
-    string line;
-
-    // Read all lines and strip whitespace globally
-    while (getline(in, line)) {
-        for (unsigned char ch : line) {
-            if (!isspace(ch)) {
-                all.push_back(ch);
-            }
-        }
-    }
-
+// Map 81 non-whitespace characters into grid[row][col]
+bool parse_grid(const string &all, int grid[9][9]) {
     if ((int)all.size() != 81) {
         cerr << "Error: expected exactly 81 non-whitespace characters, got "
              << all.size() << "\n";
         return false;
     }
 
-    // Map each of the 81 chars into grid[row][col]
     for (int k = 0; k < 81; ++k) {
         char ch = all[k];
         int r = k / 9;
@@ -160,16 +148,92 @@ bool read_grid(istream &in, int grid[9][9]) {
     return true;
 }
 
+bool read_grid(istream &in, int grid[9][9]) {
+    string all;
+    string line;
+
+    // Read all lines and strip whitespace globally
+    while (getline(in, line)) {
+        for (unsigned char ch : line) {
+            if (!isspace(ch)) {
+                all.push_back(ch);
+            }
+        }
+    }
+
+    return parse_grid(all, grid);
+}
+
+// Read the next puzzle (81 non-whitespace characters) from a stream that
+// may hold several puzzles back to back. Returns false once the stream is
+// exhausted before any character of a new puzzle was read.
+bool read_next_puzzle(istream &in, string &all) {
+    all.clear();
+    char ch;
+    while ((int)all.size() < 81 && in.get(ch)) {
+        if (!isspace((unsigned char)ch)) {
+            all.push_back(ch);
+        }
+    }
+    return !all.empty();
+}
+
+void build_clauses(const int grid[9][9]) {
+    // --- Build minimal encoding clauses ---
+    clauses.clear();
+    add_cell_at_least_one();
+    add_row_at_most_one();
+    add_col_at_most_one();
+    add_box_at_most_one();
+
+    // Add givens (unit clauses for clues)
+    add_givens(grid);
+}
+
+void write_cnf(ostream &out) {
+    // --- Output DIMACS CNF ---
+    int numClauses = (int)clauses.size();
+    out << "p cnf " << NUM_VARS << " " << numClauses << "\n";
+
+    for (const auto &cl : clauses) {
+        for (int lit : cl) {
+            out << lit << " ";
+        }
+        out << "0\n";
+    }
+}
+
+// Stream mode: encode puzzle after puzzle from STDIN, terminating each CNF
+// with a "c END" comment line and flushing so a long-lived caller can frame
+// the output without restarting the encoder for every puzzle.
+int run_stream() {
+    string all;
+    int grid[9][9];
+    while (read_next_puzzle(cin, all)) {
+        if (!parse_grid(all, grid)) {
+            return 1;
+        }
+        build_clauses(grid);
+        write_cnf(cout);
+        cout << "c END\n" << flush;
+    }
+    return 0;
+}
 
 int main(int argc, char *argv[]) {
     string filename;
 
     // Usage: sud2sat [puzzlefile]
+    //        sud2sat --stream
     // If puzzlefile is omitted, read from STDIN.
     if (argc >= 2) {
         filename = argv[1];
     }
 
+    if (filename == "--stream") {
+        return run_stream();
+    }
+
     istream *in = &cin;
     static ifstream fin;
     if (!filename.empty()) {
@@ -187,27 +251,8 @@ int main(int argc, char *argv[]) {
         return 1;
     }
 
-    // --- Build minimal encoding clauses ---
-    clauses.clear();
-    add_cell_at_least_one();
-    add_row_at_most_one();
-    add_col_at_most_one();
-    add_box_at_most_one();
-
-    // Add givens (unit clauses for clues)
-    add_givens(grid);
-
-    // --- Output DIMACS CNF ---
-    int numClauses = (int)clauses.size();
-    cout << "p cnf " << NUM_VARS << " " << numClauses << "\n";
-
-    for (const auto &cl : clauses) {
-        for (int lit : cl) {
-            cout << lit << " ";
-        }
-        cout << "0\n";
-    }
+    build_clauses(grid);
+    write_cnf(cout);
 
     return 0;
 }
-
@@ -183,26 +183,14 @@ void add_givens(const int grid[9][9]) {
   }
 }
 
-bool read_grid(istream &in, int grid[9][9]) {
-  string all;
-  string line;
-
-  // Read all lines and strip whitespace globally
-  while (getline(in, line)) {
-    for (unsigned char ch : line) {
-      if (!isspace(ch)) {
-        all.push_back(ch);
-      }
-    }
-  }
-
+// Map 81 non-whitespace characters into grid[row][col]
+bool parse_grid(const string &all, int grid[9][9]) {
   if ((int)all.size() != 81) {
     cerr << "Error: expected exactly 81 non-whitespace characters, got "
          << all.size() << "\n";
     return false;
   }
 
-  // Map each of the 81 chars into grid[row][col]
   for (int k = 0; k < 81; ++k) {
     char ch = all[k];
     int r = k / 9;
@@ -223,32 +211,37 @@ bool read_grid(istream &in, int grid[9][9]) {
   return true;
 }
 
-int main(int argc, char *argv[]) {
-  string filename;
-
-  // Usage: sud2sat1 [puzzlefile]
-  // If puzzlefile is omitted, read from STDIN.
-  if (argc >= 2) {
-    filename = argv[1];
-  }
+bool read_grid(istream &in, int grid[9][9]) {
+  string all;
+  string line;
 
-  istream *in = &cin;
-  static ifstream fin;
-  if (!filename.empty()) {
-    fin.open(filename.c_str());
-    if (!fin) {
-      cerr << "Error: cannot open puzzle file " << filename << "\n";
-      return 1;
+  // Read all lines and strip whitespace globally
+  while (getline(in, line)) {
+    for (unsigned char ch : line) {
+      if (!isspace(ch)) {
+        all.push_back(ch);
+      }
     }
-    in = &fin;
   }
 
-  int grid[9][9];
-  if (!read_grid(*in, grid)) {
-    // read_grid already prints a clear message
-    return 1;
+  return parse_grid(all, grid);
+}
+
+// Read the next puzzle (81 non-whitespace characters) from a stream that
+// may hold several puzzles back to back. Returns false once the stream is
+// exhausted before any character of a new puzzle was read.
+bool read_next_puzzle(istream &in, string &all) {
+  all.clear();
+  char ch;
+  while ((int)all.size() < 81 && in.get(ch)) {
+    if (!isspace((unsigned char)ch)) {
+      all.push_back(ch);
+    }
   }
+  return !all.empty();
+}
 
+void build_clauses(const int grid[9][9]) {
   // --- Build minimal + extended encoding clauses ---
   clauses.clear();
 
@@ -266,17 +259,71 @@ int main(int argc, char *argv[]) {
   add_row_at_least_one();
   add_col_at_least_one();
   add_box_at_least_one();
+}
 
+void write_cnf(ostream &out) {
   // --- Output DIMACS CNF ---
   int numClauses = (int)clauses.size();
-  cout << "p cnf " << NUM_VARS << " " << numClauses << "\n";
+  out << "p cnf " << NUM_VARS << " " << numClauses << "\n";
 
   for (const auto &cl : clauses) {
     for (int lit : cl) {
-      cout << lit << " ";
+      out << lit << " ";
+    }
+    out << "0\n";
+  }
+}
+
+// Stream mode: encode puzzle after puzzle from STDIN, terminating each CNF
+// with a "c END" comment line and flushing so a long-lived caller can frame
+// the output without restarting the encoder for every puzzle.
+int run_stream() {
+  string all;
+  int grid[9][9];
+  while (read_next_puzzle(cin, all)) {
+    if (!parse_grid(all, grid)) {
+      return 1;
+    }
+    build_clauses(grid);
+    write_cnf(cout);
+    cout << "c END\n" << flush;
+  }
+  return 0;
+}
+
+int main(int argc, char *argv[]) {
+  string filename;
+
+  // Usage: sud2sat1 [puzzlefile]
+  //        sud2sat1 --stream
+  // If puzzlefile is omitted, read from STDIN.
+  if (argc >= 2) {
+    filename = argv[1];
+  }
+
+  if (filename == "--stream") {
+    return run_stream();
+  }
+
+  istream *in = &cin;
+  static ifstream fin;
+  if (!filename.empty()) {
+    fin.open(filename.c_str());
+    if (!fin) {
+      cerr << "Error: cannot open puzzle file " << filename << "\n";
+      return 1;
     }
-    cout << "0\n";
+    in = &fin;
+  }
+
+  int grid[9][9];
+  if (!read_grid(*in, grid)) {
+    // read_grid already prints a clear message
+    return 1;
   }
 
+  build_clauses(grid);
+  write_cnf(cout);
+
   return 0;
 }
@@ -9,12 +9,20 @@ You can run:
 and then use the printed summary in your report.
 """
 
+import hashlib
+import multiprocessing.util
 import os
 import re
-import statistics
+import shlex
+import shutil
 import subprocess
+import sys
 import tempfile
-from typing import Dict, List, Tuple
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import IO, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple
 
 # ----------------------------------------------------------------------
 # CONFIG – change paths/command names here if needed
@@ -27,63 +35,93 @@ MINIMAL_ENCODER = "./sud2sat"
 EXTENDED_ENCODER = "./sud2sat1"
 SAT2SUD = "./sat2sud" 
 
+# Commands are split once here and executed directly (no /bin/sh).
+# Spawns use the default close_fds=True (and MiniSAT also gets pass_fds
+# for its CNF pipe), so subprocess takes its fork+exec path (vfork on
+# Linux), not posix_spawn. That is fine: encoders start once per pool
+# process, and MiniSAT's solve time dwarfs its fork.
+MINISAT_ARGV = shlex.split(MINISAT_CMD)
+MINIMAL_ARGV = shlex.split(MINIMAL_ENCODER)
+EXTENDED_ARGV = shlex.split(EXTENDED_ENCODER)
+
+# Puzzles are independent, so they are spread over a process pool
+# (MiniSAT itself is single-threaded). None = one worker per CPU core.
+MAX_WORKERS = None
+
+# Encoded CNFs are cached here, keyed by encoder binary + puzzle, so
+# re-runs (e.g. when tuning MiniSAT) skip the encoder. None = no cache.
+CNF_CACHE_DIR = ".cnfcache"
+
+# Model scratch files go to tmpfs when the machine has one.
+SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 
 # ----------------------------------------------------------------------
 # Reading the puzzles
 # ----------------------------------------------------------------------
 
-def read_puzzles(path: str) -> List[Tuple[str, List[str]]]:
+# "Grid NN" header followed by 9 rows of 9 cells. \s* between rows also
+# absorbs blank lines, "\r" and a missing newline at end of file.
+GRID_RE = re.compile(rb"^(Grid[^\n]*)\n\s*((?:[0-9.]{9}\s*){9})", re.MULTILINE)
+GRID_HEADER_RE = re.compile(rb"^Grid", re.MULTILINE)
+
+def read_puzzles(path: str) -> List[Tuple[str, bytes]]:
     """
     Reads puzzles from Project Euler p096_sudoku.txt-style file.
 
-    Returns: list of (grid_name, rows) where rows is a list of 9 strings.
+    Returns: list of (grid_name, payload) where payload is the 9 rows as
+    ready-to-send stdin bytes for sud2sat/sud2sat1 ("row\n" * 9).
     """
-    puzzles: List[Tuple[str, List[str]]] = []
-    with open(path, "r") as f:
-        lines = [line.rstrip("\n") for line in f if line.strip()]
+    with open(path, "rb") as f:
+        data = f.read()
+
+    # One regex scan over the whole file instead of a line-by-line loop;
+    # each payload is joined and encoded once, not once per encoding.
+    puzzles: List[Tuple[str, bytes]] = [
+        (name.strip().decode("ascii"), b"\n".join(block.split()) + b"\n")
+        for name, block in GRID_RE.findall(data)
+    ]
 
-    i = 0
-    while i < len(lines):
-        if lines[i].startswith("Grid"):
-            name = lines[i].strip()
-            rows = lines[i + 1:i + 10]
-            if len(rows) != 9:
-                raise ValueError(f"{name}: expected 9 puzzle rows, got {len(rows)}")
-            puzzles.append((name, rows))
-            i += 10
-        else:
-            i += 1
+    num_headers = len(GRID_HEADER_RE.findall(data))
+    if len(puzzles) != num_headers:
+        raise ValueError(
+            f"{path}: found {num_headers} grids but only {len(puzzles)} "
+            "have 9 rows of 9 digits"
+        )
 
     return puzzles
 
 
-def rows_to_stdin_text(rows: List[str]) -> str:
-    """Convert 9 lines of 9 digits into stdin text for sud2sat/sud2sat1."""
-    return "\n".join(rows) + "\n"
-
-
 # ----------------------------------------------------------------------
 # Parsing MiniSAT statistics
 # ----------------------------------------------------------------------
 
 STAT_NUMBER_RE = re.compile(r"[\d.]+")  # integer or float
 
-def parse_minisat_stats(stat_text: str) -> Dict[str, float]:
+def parse_minisat_output(lines: Iterable[str]) -> Tuple[bool, Dict[str, float]]:
     """
-    Parse MiniSAT stats from the text of stat.txt.
+    Parse MiniSAT's stdout (what used to go to stat.txt) in one pass.
 
-    For each line of the form:
+    Decides SAT / UNSAT from the "UNSATISFIABLE" line and, for each line
+    of the form:
         KEY ... : <numbers> ...
-    we store KEY -> first numeric value.
+    stores KEY -> first numeric value.
 
     Works both for lines like
         "|  Number of variables: 729 |"
     and
         "conflicts             : 0     (0 /sec)".
+
+    Returns:
+        (is_sat, stats_dict)
     """
+    is_sat = True
     stats: Dict[str, float] = {}
-    for line in stat_text.splitlines():
+    for line in lines:
         if ":" not in line:
+            # MiniSAT prints SATISFIABLE / UNSATISFIABLE on a line of its own.
+            if "UNSATISFIABLE" in line:
+                is_sat = False
             continue
 
         key, rest = line.split(":", 1)
@@ -92,78 +130,294 @@ def parse_minisat_stats(stat_text: str) -> Dict[str, float]:
         #   "|  Number of variables" -> "Number of variables"
         key = key.strip().strip("|").strip()
 
-        nums = STAT_NUMBER_RE.findall(rest)
-        if not nums:
+        # Only the first number is kept, so stop at the first match.
+        m = STAT_NUMBER_RE.search(rest)
+        if m is None:
             continue
 
-        stats[key] = float(nums[0])
+        stats[key] = float(m.group(0))
 
-    return stats
+    return is_sat, stats
 
 # ----------------------------------------------------------------------
-# Running encoder + MiniSAT for one puzzle
+# Persistent encoder workers
 # ----------------------------------------------------------------------
 
-def run_one(
-    grid_name: str,
-    rows: List[str],
-    encoder_cmd: str,
-) -> Tuple[bool, Dict[str, float]]:
+# Each encoder is started once in "--stream" mode and fed puzzle after
+# puzzle on stdin; every CNF it writes back is terminated by this line
+# (a DIMACS comment, so MiniSAT would ignore it anyway).
+ENCODER_SENTINEL = b"c END\n"
+
+_ENCODER_WORKERS: Dict[Tuple[str, ...], subprocess.Popen] = {}
+
+# Encoders whose worker has produced at least one CNF in --stream mode.
+_STREAMING_ENCODERS: Set[Tuple[str, ...]] = set()
+
+# Encoders whose worker died before its first CNF (e.g. a build from
+# before --stream existed, which takes it for a file name). These are
+# run once per puzzle instead.
+_ONE_SHOT_ENCODERS: Set[Tuple[str, ...]] = set()
+
+
+def get_encoder_worker(encoder_argv: List[str]) -> subprocess.Popen:
+    """Return the long-lived encoder process for encoder_argv, starting it if needed."""
+    key = tuple(encoder_argv)
+    proc = _ENCODER_WORKERS.get(key)
+    if proc is None or proc.poll() is not None:
+        proc = subprocess.Popen(
+            encoder_argv + ["--stream"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,  # encoders only write here on failure
+            bufsize=-1,
+        )
+        _ENCODER_WORKERS[key] = proc
+    return proc
+
+
+def close_encoder_worker(proc: subprocess.Popen) -> int:
+    """Close an encoder worker's pipes, wait for it and return its exit code."""
+    if proc.stdin:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass  # worker already gone; unflushed input is dropped
+    returncode = proc.wait()
+    for stream in (proc.stdout, proc.stderr):
+        if stream:
+            stream.close()
+    return returncode
+
+
+def close_encoder_workers() -> None:
+    """Close stdin of every encoder worker and wait for them to exit."""
+    for proc in _ENCODER_WORKERS.values():
+        close_encoder_worker(proc)
+    _ENCODER_WORKERS.clear()
+
+
+def encoder_supports_stream(encoder_argv: List[str]) -> bool:
     """
-    Run a single puzzle through one encoder and MiniSAT.
+    Check whether the encoder binary has --stream mode.
 
-    Returns:
-        (is_sat, stats_dict)
+    With empty stdin a --stream encoder exits 0 without output; a build
+    from before --stream takes it for a file name and exits 1.
+    """
+    probe = subprocess.run(
+        encoder_argv + ["--stream"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return probe.returncode == 0
+
+
+def init_pool_worker(one_shot_encoders: List[Tuple[str, ...]]) -> None:
+    """
+    Pool initializer: mark encoders known to lack --stream, and close this
+    process's encoder workers when it exits.
+
+    Pool processes leave through os._exit, which skips atexit, but
+    multiprocessing still runs its registered finalizers first.
+    """
+    _ONE_SHOT_ENCODERS.update(one_shot_encoders)
+    multiprocessing.util.Finalize(None, close_encoder_workers, exitpriority=10)
+
+
+def read_cnf_frame(stream: IO[bytes]) -> bytes:
     """
-    puzzle_text = rows_to_stdin_text(rows)
+    Glue lines from the encoder's stdout back into one CNF.
 
-    # 1) Run encoder (sud2sat or sud2sat1). It reads puzzle on stdin,
-    #    writes DIMACS CNF on stdout.
+    Reads up to (and drops) ENCODER_SENTINEL, so partial pipe reads are
+    reassembled into exactly one record. Returns b"" if the stream ends
+    before the sentinel is seen.
+    """
+    chunks: List[bytes] = []
+    while True:
+        line = stream.readline()
+        if not line:
+            return b""
+        if line == ENCODER_SENTINEL:
+            return b"".join(chunks)
+        chunks.append(line)
+
+
+def encode_puzzle_once(encoder_argv: List[str], puzzle: bytes) -> bytes:
+    """Run the encoder as a one-shot process for a single puzzle."""
     enc_proc = subprocess.run(
-        encoder_cmd,
-        input=puzzle_text.encode("ascii"),
+        encoder_argv,
+        input=puzzle,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        shell=True,  # since encoder_cmd is a simple string like "./sud2sat"
         check=True,  # crash if encoder fails
     )
-    cnf_text = enc_proc.stdout.decode("ascii")
+    return enc_proc.stdout
 
-    # 2) Write CNF to a temporary file for MiniSAT.
-    with tempfile.NamedTemporaryFile(mode="w", delete=False) as cnf_file:
-        cnf_file.write(cnf_text)
-        cnf_path = cnf_file.name
 
-    # 3) Temporary model file.
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as model_file:
-        model_path = model_file.name
+def encode_puzzle(encoder_argv: List[str], puzzle: bytes) -> bytes:
+    """Send one puzzle to the encoder worker and return its DIMACS CNF."""
+    key = tuple(encoder_argv)
+    if key in _ONE_SHOT_ENCODERS:
+        return encode_puzzle_once(encoder_argv, puzzle)
 
-    # 4) Run MiniSAT, capturing stats to stat.txt (like: minisat cnf model > stat.txt)
-    stat_path = "stat.txt"  # will be overwritten each run, which is fine
-    minisat_cmd = f"{MINISAT_CMD} {cnf_path} {model_path}"
-    with open(stat_path, "w") as stat_f:
-        minisat_proc = subprocess.run(
-            minisat_cmd,
-            stdout=stat_f,
-            stderr=subprocess.STDOUT,
-            shell=True,
-        )
+    proc = get_encoder_worker(encoder_argv)
+    assert proc.stdin is not None and proc.stdout is not None
+
+    try:
+        proc.stdin.write(puzzle)
+        proc.stdin.flush()
+    except BrokenPipeError:
+        pass  # reported below via the missing frame
+
+    cnf = read_cnf_frame(proc.stdout)
+    if not cnf:
+        _ENCODER_WORKERS.pop(key, None)
+        stderr = proc.stderr.read() if proc.stderr else None
+        returncode = close_encoder_worker(proc)
+
+        if key not in _STREAMING_ENCODERS:
+            # Never produced a CNF: assume the binary predates --stream and
+            # fall back to one process per puzzle. A puzzle the encoder
+            # really rejects still fails there, with check=True.
+            _ONE_SHOT_ENCODERS.add(key)
+            return encode_puzzle_once(encoder_argv, puzzle)
+
+        # Encoder died (e.g. rejected the puzzle); crash like check=True did.
+        raise subprocess.CalledProcessError(returncode, encoder_argv, stderr=stderr)
+
+    _STREAMING_ENCODERS.add(key)
+    return cnf
+
+# ----------------------------------------------------------------------
+# CNF cache
+# ----------------------------------------------------------------------
+
+# Hash of (encoder argv + encoder binary), computed once per process.
+_ENCODER_DIGESTS: Dict[Tuple[str, ...], "hashlib._Hash"] = {}
+
+
+def cnf_cache_path(encoder_argv: List[str], puzzle: bytes) -> str:
+    """
+    Path of the cached CNF for this encoder and puzzle.
+
+    The encoders are deterministic, so the CNF only changes when the
+    encoder binary (or its arguments) or the puzzle changes.
+    """
+    key = tuple(encoder_argv)
+    base = _ENCODER_DIGESTS.get(key)
+    if base is None:
+        base = hashlib.sha1("\0".join(encoder_argv).encode() + b"\0")
+        binary = shutil.which(encoder_argv[0]) or encoder_argv[0]
+        with open(binary, "rb") as f:
+            base.update(f.read())
+        _ENCODER_DIGESTS[key] = base
+
+    h = base.copy()
+    h.update(puzzle)
+    return os.path.join(CNF_CACHE_DIR, f"{h.hexdigest()}.cnf")
+
+
+def store_cnf(cache_path: str, cnf: bytes) -> None:
+    """Write a CNF into the cache atomically (parallel workers may race)."""
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with open(fd, "wb") as f:
+            f.write(cnf)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# ----------------------------------------------------------------------
+# Running encoder + MiniSAT for one puzzle
+# ----------------------------------------------------------------------
 
-    # 5) Read stat.txt and parse it.
-    with open(stat_path, "r") as f:
-        stat_text = f.read()
-    stats = parse_minisat_stats(stat_text)
+def feed_pipe(write_fd: int, data: bytes) -> None:
+    """Write data to a pipe and close it; stop quietly if the reader quits."""
+    with open(write_fd, "wb") as pipe:
+        try:
+            pipe.write(data)
+        except BrokenPipeError:
+            pass
 
-    # Decide SAT / UNSAT from text (MiniSAT prints these words).
-    is_sat = "UNSATISFIABLE" not in stat_text
+def run_one(
+    grid_name: str,
+    puzzle: bytes,
+    encoder_argv: List[str],
+) -> Tuple[bool, Dict[str, float]]:
+    """
+    Run a single puzzle (stdin payload from read_puzzles) through one
+    encoder and MiniSAT.
+
+    Returns:
+        (is_sat, stats_dict)
+    """
+    # 1) Reuse a cached CNF if this encoder has seen the puzzle before;
+    #    MiniSAT then reads the cache file directly.
+    cache_path = cnf_cache_path(encoder_argv, puzzle) if CNF_CACHE_DIR else None
+    cnf_data: Optional[bytes] = None
+    if cache_path is not None and os.path.exists(cache_path):
+        cnf_path = cache_path
+    else:
+        # Hand the puzzle to the encoder worker (sud2sat or sud2sat1
+        # running in --stream mode); it answers with DIMACS CNF on stdout.
+        cnf_data = encode_puzzle(encoder_argv, puzzle)
+        if cache_path is not None:
+            store_cnf(cache_path, cnf_data)
+
+        # 2) Stream the CNF to MiniSAT through a pipe (/dev/fd/N) instead
+        #    of a temporary file; a thread feeds it so MiniSAT can start
+        #    parsing while we write.
+        cnf_read_fd, cnf_write_fd = os.pipe()
+        cnf_path = f"/dev/fd/{cnf_read_fd}"
+
+    # 3) Temporary model file, in RAM-backed scratch space if any.
+    with tempfile.NamedTemporaryFile(mode="w+", dir=SCRATCH_DIR, delete=False) as model_file:
+        model_path = model_file.name
+
+    # 4) Run MiniSAT and parse its stats output (what `minisat cnf model >
+    #    stat.txt` would write) line by line as it arrives. No shared stat
+    #    file means parallel workers cannot clobber each other.
+    minisat_argv = MINISAT_ARGV + [cnf_path, model_path]
+    minisat_kwargs = dict(
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        encoding="ascii",
+        errors="replace",
+    )
+    feeder: Optional[threading.Thread] = None
+    if cnf_data is None:
+        minisat_proc = subprocess.Popen(minisat_argv, **minisat_kwargs)
+    else:
+        try:
+            minisat_proc = subprocess.Popen(
+                minisat_argv, pass_fds=(cnf_read_fd,), **minisat_kwargs
+            )
+        except BaseException:
+            os.close(cnf_write_fd)
+            raise
+        finally:
+            os.close(cnf_read_fd)  # only MiniSAT reads the CNF
+        feeder = threading.Thread(target=feed_pipe, args=(cnf_write_fd, cnf_data))
+        feeder.start()
+
+    # 5) Parse the stats and SAT / UNSAT verdict in a single pass.
+    with minisat_proc:
+        is_sat, stats = parse_minisat_output(minisat_proc.stdout)
+    if feeder is not None:
+        feeder.join()
 
     # OPTIONAL: if you want to check that sat2sud reconstructs a valid Sudoku,
     # you can call it here using `model_path` and the original puzzle.
     # I don't do this because the exact interface for sat2sud may differ.
 
-    # Clean up temp CNF + model.
+    # Clean up temp model.
     try:
-        os.remove(cnf_path)
         os.remove(model_path)
     except OSError:
         pass
@@ -188,23 +442,27 @@ def summarize_encoding(
     all_sat = all(ok for _, ok, _ in results)
     print(f"All puzzles SAT? {'YES' if all_sat else 'NO (some UNSAT or failed)'}")
 
-    # Union of all metric names we actually saw.
-    metric_names = sorted({k for _, _, stats in results for k in stats.keys()})
+    # Group values by metric in one walk over the results, instead of
+    # re-filtering every result once per metric.
+    metric_to_vals: DefaultDict[str, List[Tuple[str, float]]] = defaultdict(list)
+    for grid, _, stats in results:
+        for metric, value in stats.items():
+            metric_to_vals[metric].append((grid, value))
 
-    for metric in metric_names:
-        values: List[Tuple[str, float]] = [
-            (grid, stats[metric])
-            for grid, _, stats in results
-            if metric in stats
-        ]
-        if not values:
-            continue
+    for metric in sorted(metric_to_vals):
+        values = metric_to_vals[metric]
 
-        grids, nums = zip(*values)
-        avg = statistics.mean(nums)
-        worst_val = max(nums)
-        worst_idx = nums.index(worst_val)
-        worst_grid = grids[worst_idx]
+        # Sum and (first) worst value in a single pass.
+        total = 0.0
+        worst_val = float("-inf")
+        worst_grid = ""
+        for grid, value in values:
+            total += value
+            if value > worst_val:
+                worst_val = value
+                worst_grid = grid
+
+        avg = total / len(values)
 
         print(f"\nMetric: {metric}")
         print(f"  Average over 50 puzzles : {avg:.3f}")
@@ -219,16 +477,39 @@ def main() -> None:
     print(f"Loaded {len(puzzles)} puzzles from {PUZZLE_FILE}")
 
     encodings = [
-        ("Minimal (sud2sat)", MINIMAL_ENCODER),
-        ("Extended (sud2sat1)", EXTENDED_ENCODER),
+        ("Minimal (sud2sat)", MINIMAL_ARGV),
+        ("Extended (sud2sat1)", EXTENDED_ARGV),
     ]
 
-    for enc_name, enc_cmd in encodings:
-        enc_results: List[Tuple[str, bool, Dict[str, float]]] = []
-
-        for grid_name, rows in puzzles:
-            is_sat, stats = run_one(grid_name, rows, enc_cmd)
-            enc_results.append((grid_name, is_sat, stats))
+    grid_names = [name for name, _ in puzzles]
+    payloads = [payload for _, payload in puzzles]
+
+    for enc_name, enc_argv in encodings:
+        # Check --stream support once here, so an old encoder build is
+        # reported once and pool processes skip the doomed worker start.
+        one_shot: List[Tuple[str, ...]] = []
+        if not encoder_supports_stream(enc_argv):
+            print(
+                f"Note: {shlex.join(enc_argv)} has no --stream mode (rebuild it "
+                "from source); encoding with one process per puzzle.",
+                file=sys.stderr,
+            )
+            one_shot.append(tuple(enc_argv))
+
+        # One pool per encoding: each pool process keeps its own encoder
+        # worker alive across puzzles and closes it when the pool shuts
+        # down, so no idle encoders outlive their encoding.
+        with ProcessPoolExecutor(
+            max_workers=MAX_WORKERS,
+            initializer=init_pool_worker,
+            initargs=(one_shot,),
+        ) as pool:
+            # map() yields results in puzzle order, keeping the report stable.
+            outcomes = pool.map(run_one, grid_names, payloads, repeat(enc_argv))
+            enc_results: List[Tuple[str, bool, Dict[str, float]]] = [
+                (grid_name, is_sat, stats)
+                for grid_name, (is_sat, stats) in zip(grid_names, outcomes)
+            ]
 
         summarize_encoding(enc_name, enc_results)
 
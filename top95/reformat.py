@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 import sys
 
+VALID_CHARS = set("0123456789.")
+
 def main():
-    puzzles = []
+    parts = []
     idx = 1
 
     for line in sys.stdin:
@@ -12,19 +14,20 @@ def main():
         # Keep only proper 81-char puzzles made of digits + dots
         if len(line) != 81:
             continue
-        if not all(ch.isdigit() or ch == '.' for ch in line):
+        if not set(line) <= VALID_CHARS:
             continue
 
-        puzzles.append((idx, line))
+        # Convert '.' -> '0' once, then break into 9 rows of 9
+        converted = line.replace('.', '0')
+        parts.append(
+            f"Grid {idx:02d}\n"
+            + "\n".join(converted[j:j+9] for j in range(0, 81, 9))
+            + "\n"
+        )
         idx += 1
 
-    out = sys.stdout
-    for idx, line in puzzles:
-        out.write(f"Grid {idx:02d}\n")
-        # Break into 9 rows of 9, convert '.' -> '0'
-        for j in range(0, 81, 9):
-            row = line[j:j+9].replace('.', '0')
-            out.write(row + "\n")
+    # Emit everything with a single write
+    sys.stdout.write("".join(parts))
 
 
 if __name__ == "__main__":